@@ -1,11 +1,9 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import numpy as np
 
-from src.climate_processor import ClimateDataProcessor
+from src.climate_processor import ClimateDataProcessor, SSP_DF
 from src.scenario_generator import ScenarioGenerator
 from src.impact_assessor import ImpactAssessor
 
@@ -26,6 +24,99 @@ def initialize_components():
 
 climate_processor, scenario_generator, impact_assessor = initialize_components()
 
+# Cached computations (inputs are primitives, outputs are deterministic)
+def _hash_frame(df):
+    return pd.util.hash_pandas_object(df, index=True).values.tobytes()
+
+@st.cache_data(ttl=None, max_entries=32)
+def load_climate_scenarios(ssps: tuple):
+    climate_data = climate_processor.load_all_cmip6(ssps)
+    return climate_processor.calculate_climate_anomalies(climate_data)
+
+@st.cache_data(ttl=None, max_entries=32)
+def generate_all_scenarios(ssps: tuple, crop_type: str):
+    return scenario_generator.generate_all_scenarios(ssps, crop_type)
+
+@st.cache_data(ttl=None, max_entries=32, hash_funcs={pd.DataFrame: _hash_frame})
+def calculate_impacts(scenarios_df, baseline_scenario: str = 'SSP2-4.5'):
+    return impact_assessor.calculate_impacts(scenarios_df, baseline_scenario)
+
+@st.cache_data(ttl=None, max_entries=32, hash_funcs={pd.DataFrame: _hash_frame})
+def assess_vulnerability(impacts_df, time_period: tuple):
+    return impact_assessor.assess_vulnerability(impacts_df, time_period)
+
+def ssp_color_map(ssps):
+    return SSP_DF.loc[list(ssps), 'color'].to_dict()
+
+# Cached figure builders
+@st.cache_data(ttl=None, max_entries=32)
+def build_climate_figure(ssps: tuple, start_year: int, end_year: int):
+    climate_df = load_climate_scenarios(ssps)
+    
+    # Filter for selected period
+    climate_df = climate_df[
+        (climate_df['year'] >= start_year) & 
+        (climate_df['year'] <= end_year)
+    ]
+    
+    # Create climate visualization (one trace per SSP and variable)
+    climate_vars = {
+        'temp_anomaly': 'Temperature Anomaly (°C)',
+        'precip_anomaly': 'Precipitation Anomaly (%)'
+    }
+    climate_long = climate_df.rename(columns=climate_vars).melt(
+        id_vars=['year', 'scenario'],
+        value_vars=list(climate_vars.values())
+    )
+    
+    fig = px.line(
+        climate_long,
+        x='year',
+        y='value',
+        color='scenario',
+        facet_row='variable',
+        category_orders={'variable': list(climate_vars.values())},
+        color_discrete_map=ssp_color_map(ssps),
+        labels={'value': '', 'year': 'Year'},
+        facet_row_spacing=0.1,
+        render_mode='webgl'
+    )
+    fig.for_each_annotation(lambda a: a.update(text=a.text.split('=')[-1]))
+    fig.update_yaxes(matches=None)
+    fig.update_layout(height=600, title_text="Climate Projections for African Regions")
+    
+    return fig
+
+@st.cache_data(ttl=None, max_entries=32)
+def build_yield_figure(ssps: tuple, regions: tuple, start_year: int, end_year: int):
+    scenarios_df = generate_all_scenarios(ssps, 'Maize')
+    
+    # Filter for selected period and regions
+    region_data = scenarios_df[
+        (scenarios_df['year'] >= start_year) & 
+        (scenarios_df['year'] <= end_year) &
+        scenarios_df['region'].isin(regions)
+    ]
+    
+    # One faceted figure instead of a separate figure per region
+    fig = px.line(
+        region_data,
+        x='year',
+        y='yield', 
+        color='scenario',
+        facet_col='region',
+        facet_col_wrap=2,
+        category_orders={'region': list(regions)},
+        color_discrete_map=ssp_color_map(ssps),
+        title="Maize Yield Projections by Region",
+        labels={'yield': 'Yield (tons/ha)', 'year': 'Year'},
+        render_mode='webgl'  # Scattergl traces scale to large ensembles
+    )
+    fig.for_each_annotation(lambda a: a.update(text=a.text.split('=')[-1]))
+    fig.update_layout(height=350 * max(1, (len(regions) + 1) // 2))
+    
+    return fig
+
 # Title and introduction
 st.title("🌾 Climate-Change Driven Agricultural Yield Prediction using CMIP6 Data")
 st.markdown("""
@@ -36,25 +127,32 @@ This tool analyzes how different socioeconomic pathways (SSPs) will affect Afric
 # Sidebar
 st.sidebar.header("🔧 Analysis Parameters")
 
-# Scenario selection
-selected_ssps = st.sidebar.multiselect(
-    "SSP Scenarios to Compare",
-    ['SSP1-2.6', 'SSP2-4.5', 'SSP3-7.0', 'SSP5-8.5'],
-    default=['SSP1-2.6', 'SSP2-4.5', 'SSP5-8.5']
-)
-
-# Region selection
-selected_regions = st.sidebar.multiselect(
-    "Regions",
-    ['West Africa', 'East Africa', 'Southern Africa', 'Central Africa'],
-    default=['West Africa', 'East Africa', 'Southern Africa']
-)
+# Parameters are batched in a form so edits trigger one rerun on "Apply"
+with st.sidebar.form("params"):
+    # Scenario selection
+    selected_ssps = st.multiselect(
+        "SSP Scenarios to Compare",
+        ['SSP1-2.6', 'SSP2-4.5', 'SSP3-7.0', 'SSP5-8.5'],
+        default=['SSP1-2.6', 'SSP2-4.5', 'SSP5-8.5']
+    )
+    
+    # Region selection
+    selected_regions = st.multiselect(
+        "Regions",
+        ['West Africa', 'East Africa', 'Southern Africa', 'Central Africa'],
+        default=['West Africa', 'East Africa', 'Southern Africa']
+    )
+    
+    # Time period
+    start_year, end_year = st.slider(
+        "Analysis Period",
+        2020, 2100, (2030, 2080)
+    )
+    
+    st.form_submit_button("Apply")
 
-# Time period
-start_year, end_year = st.sidebar.slider(
-    "Analysis Period",
-    2020, 2100, (2030, 2080)
-)
+# Scenario colors, looked up once per rerun
+ssp_colors = ssp_color_map(selected_ssps)
 
 # Main tabs
 tab1, tab2, tab3, tab4 = st.tabs([
@@ -73,24 +171,16 @@ with tab1:
         st.subheader("Radiative Forcing Comparison")
         
         # Forcing comparison chart
-        forcing_data = []
-        for ssp in selected_ssps:
-            info = climate_processor.ssp_definitions[ssp]
-            forcing_data.append({
-                'Scenario': ssp,
-                'Radiative Forcing (W/m²)': info['forcing'],
-                'Description': info['description'],
-                'Color': info['color']
-            })
-        
-        forcing_df = pd.DataFrame(forcing_data)
+        forcing_df = SSP_DF.loc[selected_ssps].reset_index(names='Scenario').rename(
+            columns={'forcing': 'Radiative Forcing (W/m²)'}
+        )
         
         fig = px.bar(
             forcing_df, 
             x='Scenario', 
             y='Radiative Forcing (W/m²)',
             color='Scenario',
-            color_discrete_map={row['Scenario']: row['Color'] for row in forcing_data},
+            color_discrete_map=ssp_colors,
             title="Radiative Forcing by SSP Scenario"
         )
         st.plotly_chart(fig, use_container_width=True)
@@ -121,61 +211,7 @@ with tab2:
     # Generate and display climate data
     if st.button("Generate Climate Scenarios", type="primary"):
         with st.spinner("Generating climate projections..."):
-            all_climate_data = []
-            
-            for ssp in selected_ssps:
-                climate_data = climate_processor.load_cmip6_data(ssp)
-                climate_data = climate_processor.calculate_climate_anomalies(climate_data)
-                all_climate_data.append(climate_data)
-            
-            climate_df = pd.concat(all_climate_data, ignore_index=True)
-            
-            # Filter for selected period
-            climate_df = climate_df[
-                (climate_df['year'] >= start_year) & 
-                (climate_df['year'] <= end_year)
-            ]
-            
-            # Create climate visualization
-            fig = make_subplots(
-                rows=2, cols=1,
-                subplot_titles=('Temperature Anomalies', 'Precipitation Changes'),
-                vertical_spacing=0.1
-            )
-            
-            for ssp in selected_ssps:
-                ssp_data = climate_df[climate_df['scenario'] == ssp]
-                info = climate_processor.ssp_definitions[ssp]
-                
-                # Temperature anomalies
-                fig.add_trace(
-                    go.Scatter(
-                        x=ssp_data['year'], 
-                        y=ssp_data['temp_anomaly'],
-                        name=f"{ssp} Temperature",
-                        line=dict(color=info['color']),
-                        legendgroup=ssp
-                    ),
-                    row=1, col=1
-                )
-                
-                # Precipitation anomalies
-                fig.add_trace(
-                    go.Scatter(
-                        x=ssp_data['year'],
-                        y=ssp_data['precip_anomaly'], 
-                        name=f"{ssp} Precipitation",
-                        line=dict(color=info['color'], dash='dash'),
-                        legendgroup=ssp,
-                        showlegend=False
-                    ),
-                    row=2, col=1
-                )
-            
-            fig.update_layout(height=600, title_text="Climate Projections for African Regions")
-            fig.update_yaxes(title_text="Temperature Anomaly (°C)", row=1, col=1)
-            fig.update_yaxes(title_text="Precipitation Anomaly (%)", row=2, col=1)
-            
+            fig = build_climate_figure(tuple(selected_ssps), start_year, end_year)
             st.plotly_chart(fig, use_container_width=True)
 
 with tab3:
@@ -184,12 +220,7 @@ with tab3:
     if st.button("Generate Yield Projections", type="primary"):
         with st.spinner("Calculating yield impacts..."):
             # Generate agricultural scenarios
-            all_scenarios = []
-            for ssp in selected_ssps:
-                scenario_data = scenario_generator.generate_agricultural_scenarios(ssp, 'Maize')
-                all_scenarios.append(scenario_data)
-            
-            scenarios_df = pd.concat(all_scenarios, ignore_index=True)
+            scenarios_df = generate_all_scenarios(tuple(selected_ssps), 'Maize')
             
             # Filter for selected period
             scenarios_df = scenarios_df[
@@ -198,41 +229,31 @@ with tab3:
             ]
             
             # Calculate impacts
-            impacts_df = impact_assessor.calculate_impacts(scenarios_df)
+            impacts_df = calculate_impacts(scenarios_df)
             
             # Display yield projections
             st.subheader("Maize Yield Projections by Region")
             
-            for region in selected_regions:
-                region_data = scenarios_df[scenarios_df['region'] == region]
-                
-                fig = px.line(
-                    region_data,
-                    x='year',
-                    y='yield', 
-                    color='scenario',
-                    color_discrete_map={ssp: climate_processor.ssp_definitions[ssp]['color'] 
-                                      for ssp in selected_ssps},
-                    title=f"Maize Yield Projections: {region}",
-                    labels={'yield': 'Yield (tons/ha)', 'year': 'Year'}
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
+            fig = build_yield_figure(
+                tuple(selected_ssps), tuple(selected_regions), start_year, end_year
+            )
+            st.plotly_chart(fig, use_container_width=True)
             
             # Show impacts table
             st.subheader("Climate Impact Assessment")
             
-            vulnerability = impact_assessor.assess_vulnerability(impacts_df, (2050, 2070))
+            vulnerability = assess_vulnerability(impacts_df, (2050, 2070))
             
-            # Color code vulnerability levels
-            def color_vulnerability(val):
-                if val == 'Extreme': return 'background-color: #FF6B6B'
-                elif val == 'High': return 'background-color: #FFA500' 
-                elif val == 'Medium': return 'background-color: #FFD700'
-                elif val == 'Low': return 'background-color: #90EE90'
-                else: return 'background-color: #32CD32'
+            # Color code vulnerability levels (one vectorized call per column)
+            def color_vulnerability(levels):
+                return np.select(
+                    [levels == 'Extreme', levels == 'High', levels == 'Medium', levels == 'Low'],
+                    ['background-color: #FF6B6B', 'background-color: #FFA500',
+                     'background-color: #FFD700', 'background-color: #90EE90'],
+                    default='background-color: #32CD32'
+                )
             
-            styled_vulnerability = vulnerability.style.applymap(
+            styled_vulnerability = vulnerability.style.apply(
                 color_vulnerability, subset=['vulnerability_level']
             )
             
@@ -1,86 +1,114 @@
-import xarray as xr
 import pandas as pd
 import numpy as np
 
+# SSP-specific warming trends (°C/year)
+WARMING_RATES = {
+    'SSP1-2.6': 0.01,
+    'SSP2-4.5': 0.02,
+    'SSP3-7.0': 0.03,
+    'SSP5-8.5': 0.04
+}
+
+# SSP-specific precipitation trends (mm/year)
+PRECIP_TRENDS = {
+    'SSP1-2.6': -0.5,
+    'SSP2-4.5': -1.0,
+    'SSP3-7.0': -2.0,
+    'SSP5-8.5': -3.0
+}
+
+SSP_DEFINITIONS = {
+    'SSP1-2.6': {
+        'name': 'Sustainability',
+        'forcing': 2.6,
+        'description': 'Green growth, low challenges',
+        'color': '#2E8B57'  # SeaGreen
+    },
+    'SSP2-4.5': {
+        'name': 'Middle Road', 
+        'forcing': 4.5,
+        'description': 'Historical patterns continue',
+        'color': '#FFA500'  # Orange
+    },
+    'SSP3-7.0': {
+        'name': 'Regional Rivalry',
+        'forcing': 7.0, 
+        'description': 'High challenges, fragmentation',
+        'color': '#DC143C'  # Crimson
+    },
+    'SSP5-8.5': {
+        'name': 'Fossil-fueled Development',
+        'forcing': 8.5,
+        'description': 'Rapid growth, high emissions',
+        'color': '#8B0000'  # DarkRed
+    }
+}
+
+# Static SSP attributes as a table, indexed by scenario name
+SSP_DF = pd.DataFrame.from_dict(SSP_DEFINITIONS, orient='index')
+
 class ClimateDataProcessor:
+    # Historical (1991-2020) baseline climate for Africa
+    BASELINE_TEMP = 25.0  # °C
+    BASELINE_PRECIP = 800.0  # mm/year
+    
     def __init__(self):
-        self.ssp_definitions = {
-            'SSP1-2.6': {
-                'name': 'Sustainability',
-                'forcing': 2.6,
-                'description': 'Green growth, low challenges',
-                'color': '#2E8B57'  # SeaGreen
-            },
-            'SSP2-4.5': {
-                'name': 'Middle Road', 
-                'forcing': 4.5,
-                'description': 'Historical patterns continue',
-                'color': '#FFA500'  # Orange
-            },
-            'SSP3-7.0': {
-                'name': 'Regional Rivalry',
-                'forcing': 7.0, 
-                'description': 'High challenges, fragmentation',
-                'color': '#DC143C'  # Crimson
-            },
-            'SSP5-8.5': {
-                'name': 'Fossil-fueled Development',
-                'forcing': 8.5,
-                'description': 'Rapid growth, high emissions',
-                'color': '#8B0000'  # DarkRed
-            }
-        }
+        self.ssp_definitions = SSP_DEFINITIONS
+        
+        # Interannual variability, drawn once per SSP for reproducible results
+        self.years = np.arange(2020, 2101)
+        rng = np.random.default_rng(42)
+        shape = (len(self.ssp_definitions), len(self.years))
+        self._noise_temp = rng.normal(0, 0.5, shape)
+        self._noise_precip = rng.normal(0, 50, shape)
     
     def load_cmip6_data(self, ssp_scenario, variable='tas', region='Africa'):
         """Load CMIP6 climate projections for a specific SSP"""
+        return self.load_all_cmip6((ssp_scenario,), variable, region)
+    
+    def load_all_cmip6(self, ssps, variable='tas', region='Africa'):
+        """Load CMIP6 climate projections for several SSPs in one pass"""
         # For demo, we create synthetic data. Replace with actual CMIP6 data later.
         
-        years = np.arange(2020, 2101)
+        ssps = list(ssps)
+        years = self.years
+        n_ssp, n_year = len(ssps), len(years)
+        ssp_rows = np.array([list(self.ssp_definitions).index(ssp) for ssp in ssps], dtype=int)
         
-        # Base climate with SSP-specific warming trends
-        warming_rates = {
-            'SSP1-2.6': 0.01,  # °C/year
-            'SSP2-4.5': 0.02,
-            'SSP3-7.0': 0.03, 
-            'SSP5-8.5': 0.04
-        }
+        # Broadcast SSP-specific trends [n_ssp, 1] against elapsed years [1, n_year]
+        warming = np.array([WARMING_RATES[ssp] for ssp in ssps], dtype=float)[:, None]
+        precip_trend = np.array([PRECIP_TRENDS[ssp] for ssp in ssps], dtype=float)[:, None]
+        elapsed = (years - 2020)[None, :]
         
-        base_temp = 25.0  # Base temperature for Africa
-        temperatures = base_temp + warming_rates[ssp_scenario] * (years - 2020)
+        temperatures = self.BASELINE_TEMP + warming * elapsed
+        temperatures += self._noise_temp[ssp_rows]
         
-        # Add realistic interannual variability
-        np.random.seed(42)  # For reproducible results
-        noise = np.random.normal(0, 0.5, len(years))
-        temperatures += noise
+        precipitation = self.BASELINE_PRECIP + precip_trend * elapsed
+        precipitation += self._noise_precip[ssp_rows]
+        precipitation = np.maximum(200, precipitation)  # Minimum 200mm
         
-        # Precipitation changes (SSP-specific)
-        precip_trends = {
-            'SSP1-2.6': -0.5,    # mm/year
-            'SSP2-4.5': -1.0,
-            'SSP3-7.0': -2.0,
-            'SSP5-8.5': -3.0
-        }
-        
-        base_precip = 800  # mm/year base
-        precipitation = base_precip + precip_trends[ssp_scenario] * (years - 2020)
-        precip_noise = np.random.normal(0, 50, len(years))
-        precipitation = np.maximum(200, precipitation + precip_noise)  # Minimum 200mm
+        forcing = [self.ssp_definitions[ssp]['forcing'] for ssp in ssps]
         
         return pd.DataFrame({
-            'year': years,
-            'temperature': temperatures,
-            'precipitation': precipitation,
-            'scenario': ssp_scenario,
-            'forcing': self.ssp_definitions[ssp_scenario]['forcing']
+            'year': np.tile(years, n_ssp),
+            'temperature': temperatures.ravel(),
+            'precipitation': precipitation.ravel(),
+            'scenario': pd.Categorical.from_codes(
+                np.repeat(ssp_rows, n_year), categories=list(self.ssp_definitions)
+            ),
+            'forcing': np.repeat(forcing, n_year)
         })
     
-    def calculate_climate_anomalies(self, scenario_data, baseline_period=(1991, 2020)):
-        """Calculate climate anomalies relative to baseline"""
-        baseline_mask = (scenario_data['year'] >= baseline_period[0]) & (scenario_data['year'] <= baseline_period[1])
-        baseline_temp = scenario_data[baseline_mask]['temperature'].mean()
-        baseline_precip = scenario_data[baseline_mask]['precipitation'].mean()
+    def calculate_climate_anomalies(self, scenario_data):
+        """Calculate climate anomalies relative to the 1991-2020 baseline"""
+        # The synthetic projections start in 2020, so the historical baseline is a constant
+        temperature = scenario_data['temperature'].to_numpy()
+        precipitation = scenario_data['precipitation'].to_numpy()
+        
+        precip_anomaly = precipitation - self.BASELINE_PRECIP
+        precip_anomaly *= 100 / self.BASELINE_PRECIP
         
-        scenario_data['temp_anomaly'] = scenario_data['temperature'] - baseline_temp
-        scenario_data['precip_anomaly'] = (scenario_data['precipitation'] - baseline_precip) / baseline_precip * 100
+        scenario_data['temp_anomaly'] = temperature - self.BASELINE_TEMP
+        scenario_data['precip_anomaly'] = precip_anomaly
         
         return scenario_data
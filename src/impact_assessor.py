@@ -2,40 +2,42 @@ import pandas as pd
 import numpy as np
 
 class ImpactAssessor:
-    def __init__(self):
-        self.metrics = {}
-    
-    def calculate_impacts(self, scenarios_df, baseline_scenario='SSP2-4.5'):
+    @staticmethod
+    def calculate_impacts(scenarios_df, baseline_scenario='SSP2-4.5'):
         """Calculate climate impacts relative to baseline scenario"""
         
-        impacts = []
-        
-        for ssp in scenarios_df['scenario'].unique():
-            if ssp == baseline_scenario:
-                continue
-                
-            ssp_data = scenarios_df[scenarios_df['scenario'] == ssp].copy()
-            baseline_data = scenarios_df[scenarios_df['scenario'] == baseline_scenario].copy()
-            
-            # Merge to compare same years and regions
-            comparison = pd.merge(
-                ssp_data, 
-                baseline_data[['year', 'region', 'yield', 'temperature', 'precipitation']],
-                on=['year', 'region'], 
-                suffixes=('_ssp', '_baseline')
-            )
-            
-            # Calculate impacts
-            comparison['yield_impact'] = comparison['yield_ssp'] - comparison['yield_baseline']
-            comparison['yield_impact_pct'] = (comparison['yield_impact'] / comparison['yield_baseline']) * 100
-            comparison['temp_change'] = comparison['temperature_ssp'] - comparison['temperature_baseline']
-            comparison['precip_change'] = comparison['precipitation_ssp'] - comparison['precipitation_baseline']
-            
-            impacts.append(comparison)
-        
-        return pd.concat(impacts, ignore_index=True)
+        keys = ['year', 'region']
+        metrics = ['yield', 'temperature', 'precipitation']
+        is_baseline = scenarios_df['scenario'] == baseline_scenario
+        
+        # Align baseline values to every other scenario's rows on (year, region)
+        baseline = scenarios_df.loc[is_baseline].set_index(keys)[metrics]
+        comparison = scenarios_df.loc[~is_baseline].rename(
+            columns={metric: f'{metric}_ssp' for metric in metrics}
+        )
+        aligned = baseline.reindex(pd.MultiIndex.from_frame(comparison[keys]))
+        for metric in metrics:
+            comparison[f'{metric}_baseline'] = aligned[metric].to_numpy()
+        
+        # Keep only rows with a baseline counterpart, as an inner merge would
+        comparison = comparison.dropna(
+            subset=[f'{metric}_baseline' for metric in metrics]
+        ).reset_index(drop=True)
+        
+        # Calculate impacts for every metric in one array subtraction
+        ssp_values = comparison[[f'{metric}_ssp' for metric in metrics]].to_numpy()
+        baseline_values = comparison[[f'{metric}_baseline' for metric in metrics]].to_numpy()
+        changes = ssp_values - baseline_values
+        
+        comparison['yield_impact'] = changes[:, 0]
+        comparison['yield_impact_pct'] = (changes[:, 0] / baseline_values[:, 0]) * 100
+        comparison['temp_change'] = changes[:, 1]
+        comparison['precip_change'] = changes[:, 2]
+        
+        return comparison
     
-    def assess_vulnerability(self, impacts_df, time_period=(2040, 2060)):
+    @staticmethod
+    def assess_vulnerability(impacts_df, time_period=(2040, 2060)):
         """Assess regional vulnerability to climate change"""
         
         period_data = impacts_df[
@@ -43,7 +45,7 @@ class ImpactAssessor:
             (impacts_df['year'] <= time_period[1])
         ]
         
-        vulnerability = period_data.groupby(['region', 'scenario']).agg({
+        vulnerability = period_data.groupby(['region', 'scenario'], observed=True).agg({
             'yield_impact_pct': 'mean',
             'temp_change': 'mean',
             'precip_change': 'mean'
@@ -1,6 +1,77 @@
 import pandas as pd
 import numpy as np
 
+# Regional climate modifiers
+REGION_MODIFIERS = {
+    'West Africa': {'temp_modifier': 1.0, 'precip_modifier': 0.9},
+    'East Africa': {'temp_modifier': 0.8, 'precip_modifier': 0.7},
+    'Southern Africa': {'temp_modifier': 1.2, 'precip_modifier': 0.6},
+    'Central Africa': {'temp_modifier': 0.9, 'precip_modifier': 1.1}
+}
+
+# SSP-specific agricultural development assumptions
+AG_ASSUMPTIONS = {
+    'SSP1-2.6': {
+        'tech_growth': 0.02,  # 2% annual yield improvement from technology
+        'water_management': 'efficient',
+        'fertilizer_use': 'moderate',
+        'mechanization': 'medium',
+        'trade_openness': 'high',
+        'conflict_risk': 'low'
+    },
+    'SSP2-4.5': {
+        'tech_growth': 0.015,
+        'water_management': 'moderate', 
+        'fertilizer_use': 'high',
+        'mechanization': 'medium',
+        'trade_openness': 'medium',
+        'conflict_risk': 'medium'
+    },
+    'SSP3-7.0': {
+        'tech_growth': 0.008,
+        'water_management': 'poor',
+        'fertilizer_use': 'low', 
+        'mechanization': 'low',
+        'trade_openness': 'low',
+        'conflict_risk': 'high'
+    },
+    'SSP5-8.5': {
+        'tech_growth': 0.025,
+        'water_management': 'high_tech',
+        'fertilizer_use': 'very_high',
+        'mechanization': 'high',
+        'trade_openness': 'medium',
+        'conflict_risk': 'medium'
+    }
+}
+
+def _yield_kernel(temperature, precipitation, years_from_base, tech_growth, base_yield):
+    """Fused crop yield response over broadcastable arrays, accumulated in one output buffer"""
+    
+    # Temperature effect: quadratic around 25°C, extra linear penalty above 30°C
+    out = temperature - 25
+    np.square(out, out=out)
+    out *= -0.05
+    out += 1.0
+    heat = temperature - 30
+    np.maximum(heat, 0, out=heat)
+    heat *= 0.1
+    out -= heat
+    
+    # Precipitation effect: optimal between 400 and 800 mm
+    precip_effect = np.abs(precipitation - 600)
+    precip_effect *= -0.001
+    precip_effect += 1.0
+    precip_effect[(precipitation >= 400) & (precipitation <= 800)] = 1.0
+    out *= precip_effect
+    
+    # Technological improvement over time
+    out *= np.power(1 + tech_growth, years_from_base)
+    out *= base_yield
+    
+    # Apply bounds (realistic yield range)
+    return np.clip(out, 0.5, 6.0, out=out)
+
 class ScenarioGenerator:
     def __init__(self, climate_processor):
         self.climate_processor = climate_processor
@@ -8,114 +79,56 @@ class ScenarioGenerator:
         
     def generate_agricultural_scenarios(self, ssp_scenario, crop_type='Maize'):
         """Generate comprehensive agricultural scenarios for each SSP"""
+        return self.generate_all_scenarios((ssp_scenario,), crop_type)
+    
+    def generate_all_scenarios(self, ssp_scenarios, crop_type='Maize'):
+        """Generate agricultural scenarios for several SSPs as one frame"""
         
-        # Get climate projections
-        climate_data = self.climate_processor.load_cmip6_data(ssp_scenario)
+        # Get climate projections for every SSP in one pass
+        climate_data = self.climate_processor.load_all_cmip6(ssp_scenarios)
         climate_data = self.climate_processor.calculate_climate_anomalies(climate_data)
         
-        # SSP-specific agricultural assumptions
-        ag_assumptions = self._get_agricultural_assumptions(ssp_scenario, crop_type)
+        # Work on an [ssp, region, year] grid; rows come out SSP-major, then region, then year
+        n_ssp, n_reg, n_year = len(ssp_scenarios), len(self.regions), len(self.climate_processor.years)
+        shape = (n_ssp, n_reg, n_year)
         
-        scenarios = []
-        for region in self.regions:
-            region_scenario = self._generate_region_scenario(
-                climate_data, ag_assumptions, region, crop_type
-            )
-            scenarios.append(region_scenario)
+        def expand(values):
+            """Broadcast a per-(SSP, year) climate column across regions and flatten"""
+            return np.broadcast_to(np.asarray(values).reshape(n_ssp, 1, n_year), shape).ravel()
         
-        return pd.concat(scenarios, ignore_index=True)
-    
-    def _get_agricultural_assumptions(self, ssp_scenario, crop_type):
-        """Get SSP-specific agricultural development assumptions"""
-        
-        assumptions = {
-            'SSP1-2.6': {
-                'tech_growth': 0.02,  # 2% annual yield improvement from technology
-                'water_management': 'efficient',
-                'fertilizer_use': 'moderate',
-                'mechanization': 'medium',
-                'trade_openness': 'high',
-                'conflict_risk': 'low'
-            },
-            'SSP2-4.5': {
-                'tech_growth': 0.015,
-                'water_management': 'moderate', 
-                'fertilizer_use': 'high',
-                'mechanization': 'medium',
-                'trade_openness': 'medium',
-                'conflict_risk': 'medium'
-            },
-            'SSP3-7.0': {
-                'tech_growth': 0.008,
-                'water_management': 'poor',
-                'fertilizer_use': 'low', 
-                'mechanization': 'low',
-                'trade_openness': 'low',
-                'conflict_risk': 'high'
-            },
-            'SSP5-8.5': {
-                'tech_growth': 0.025,
-                'water_management': 'high_tech',
-                'fertilizer_use': 'very_high',
-                'mechanization': 'high',
-                'trade_openness': 'medium',
-                'conflict_risk': 'medium'
-            }
-        }
-        
-        return assumptions[ssp_scenario]
-    
-    def _generate_region_scenario(self, climate_data, ag_assumptions, region, crop_type):
-        """Generate scenario for a specific region"""
+        # Regional climate modifiers, shaped [1, n_reg, 1]
+        temp_modifier = np.array([REGION_MODIFIERS[r]['temp_modifier'] for r in self.regions])[None, :, None]
+        precip_modifier = np.array([REGION_MODIFIERS[r]['precip_modifier'] for r in self.regions])[None, :, None]
         
-        scenario_data = climate_data.copy()
-        scenario_data['region'] = region
-        scenario_data['crop_type'] = crop_type
+        temperature = climate_data['temperature'].to_numpy().reshape(n_ssp, 1, n_year) * temp_modifier
+        precipitation = climate_data['precipitation'].to_numpy().reshape(n_ssp, 1, n_year) * precip_modifier
         
-        # Regional climate modifiers
-        region_modifiers = {
-            'West Africa': {'temp_modifier': 1.0, 'precip_modifier': 0.9},
-            'East Africa': {'temp_modifier': 0.8, 'precip_modifier': 0.7},
-            'Southern Africa': {'temp_modifier': 1.2, 'precip_modifier': 0.6},
-            'Central Africa': {'temp_modifier': 0.9, 'precip_modifier': 1.1}
-        }
-        
-        mod = region_modifiers[region]
-        scenario_data['temperature'] *= mod['temp_modifier']
-        scenario_data['precipitation'] *= mod['precip_modifier']
+        # SSP-specific agricultural assumptions, shaped [n_ssp, 1, 1]
+        tech_growth = np.array([
+            self._get_agricultural_assumptions(ssp, crop_type)['tech_growth'] for ssp in ssp_scenarios
+        ], dtype=float)[:, None, None]
         
         # Calculate yield impacts
-        scenario_data = self._calculate_yield_impacts(scenario_data, ag_assumptions)
-        
-        return scenario_data
-    
-    def _calculate_yield_impacts(self, scenario_data, ag_assumptions):
-        """Calculate crop yield impacts under climate change"""
-        
-        # Base yield (tons/ha)
         base_yield = 2.5  # Average maize yield in Africa
-        
-        # Climate impact function
-        temp_effect = np.where(
-            scenario_data['temperature'] <= 30,
-            1.0 - 0.05 * (scenario_data['temperature'] - 25)**2,
-            1.0 - 0.05 * (scenario_data['temperature'] - 25)**2 - 0.1 * (scenario_data['temperature'] - 30)
-        )
-        
-        precip_effect = np.where(
-            (scenario_data['precipitation'] >= 400) & (scenario_data['precipitation'] <= 800),
-            1.0,
-            1.0 - 0.001 * np.abs(scenario_data['precipitation'] - 600)
-        )
-        
-        # Technological improvement over time
-        years_from_base = scenario_data['year'] - 2020
-        tech_improvement = (1 + ag_assumptions['tech_growth']) ** years_from_base
-        
-        # Calculate final yield
-        scenario_data['yield'] = base_yield * temp_effect * precip_effect * tech_improvement
-        
-        # Apply bounds (realistic yield range)
-        scenario_data['yield'] = np.clip(scenario_data['yield'], 0.5, 6.0)
-        
-        return scenario_data
+        years_from_base = (self.climate_processor.years - 2020)[None, None, :]
+        yields = _yield_kernel(temperature, precipitation, years_from_base, tech_growth, base_yield)
+        
+        scenario = climate_data['scenario']
+        return pd.DataFrame({
+            'year': expand(climate_data['year']),
+            'temperature': temperature.ravel(),
+            'precipitation': precipitation.ravel(),
+            'scenario': pd.Categorical.from_codes(expand(scenario.cat.codes), dtype=scenario.dtype),
+            'forcing': expand(climate_data['forcing']),
+            'temp_anomaly': expand(climate_data['temp_anomaly']),
+            'precip_anomaly': expand(climate_data['precip_anomaly']),
+            'region': pd.Categorical.from_codes(
+                np.broadcast_to(np.arange(n_reg)[None, :, None], shape).ravel(), categories=self.regions
+            ),
+            'crop_type': pd.Categorical.from_codes(np.zeros(temperature.size, dtype=int), categories=[crop_type]),
+            'yield': yields.ravel()
+        })
+    
+    def _get_agricultural_assumptions(self, ssp_scenario, crop_type):
+        """Get SSP-specific agricultural development assumptions"""
+        return AG_ASSUMPTIONS[ssp_scenario]